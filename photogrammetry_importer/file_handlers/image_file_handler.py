@@ -1,4 +1,6 @@
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from photogrammetry_importer.blender_utility.logging_utility import log_report
 
 
@@ -7,12 +9,12 @@ class ImageFileHandler:
 
     PILImage = None
 
-    @classmethod
-    def read_image_size(
-        cls, image_ifp, default_width, default_height, op=None
-    ):
-        """Read image size from disk."""
+    # Reading the image sizes is I/O bound, i.e. the number of threads may
+    # exceed the number of cores.
+    max_num_threads = 32
 
+    @classmethod
+    def _import_pil_image(cls):
         if cls.PILImage is None:
             try:
                 from PIL import Image as _PILImage
@@ -21,12 +23,70 @@ class ImageFileHandler:
             except ImportError:
                 pass
 
-        if cls.PILImage is not None and os.path.isfile(image_ifp):
+    @staticmethod
+    def _read_jpeg_size(image_file):
+        # The size is stored in the "Start Of Frame" segment. Since the
+        # segments before can have arbitrary sizes (e.g. EXIF data), the
+        # segment headers are traversed until the SOF marker is found.
+        image_file.seek(2)
+        while True:
+            marker_start = image_file.read(1)
+            if marker_start != b"\xff":
+                return None
+            marker = image_file.read(1)
+            while marker == b"\xff":  # Skip fill bytes
+                marker = image_file.read(1)
+            if len(marker) == 0:
+                return None
+            marker = ord(marker)
+            if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+                # Markers without a segment
+                continue
+            segment_length_bytes = image_file.read(2)
+            if len(segment_length_bytes) != 2:
+                return None
+            segment_length = struct.unpack(">H", segment_length_bytes)[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                sof_bytes = image_file.read(5)
+                if len(sof_bytes) != 5:
+                    return None
+                height, width = struct.unpack(">HH", sof_bytes[1:5])
+                return width, height
+            image_file.seek(segment_length - 2, os.SEEK_CUR)
+
+    @classmethod
+    def _read_image_size_from_header(cls, image_ifp):
+        # Read the size of PNG and JPEG images directly from the file header,
+        # which avoids the (comparatively expensive) format detection of PIL.
+        # Returns None for other formats.
+        with open(image_ifp, "rb") as image_file:
+            header = image_file.read(24)
+            if header.startswith(b"\x89PNG\r\n\x1a\n"):
+                if len(header) == 24 and header[12:16] == b"IHDR":
+                    width, height = struct.unpack(">II", header[16:24])
+                    return width, height
+            elif header.startswith(b"\xff\xd8"):
+                return cls._read_jpeg_size(image_file)
+        return None
+
+    @classmethod
+    def _read_image_size_from_disk(cls, image_ifp):
+        # Return None, if the size can not be determined. This method does
+        # not report anything, so it can be safely called by worker threads.
+        if not os.path.isfile(image_ifp):
+            return None
+        image_size = cls._read_image_size_from_header(image_ifp)
+        if image_size is None and cls.PILImage is not None:
             # This does NOT load the data into memory -> should be fast!
-            image = cls.PILImage.open(image_ifp)
-            width, height = image.size
-            success = True
-        elif default_width > 0 and default_height > 0:
+            with cls.PILImage.open(image_ifp) as image:
+                image_size = image.size
+        return image_size
+
+    @classmethod
+    def _get_default_image_size(
+        cls, image_ifp, default_width, default_height, op=None
+    ):
+        if default_width > 0 and default_height > 0:
             width = default_width
             height = default_height
             log_report(
@@ -80,3 +140,50 @@ class ImageFileHandler:
             height = None
             success = False
         return success, width, height
+
+    @classmethod
+    def read_image_size(
+        cls, image_ifp, default_width, default_height, op=None
+    ):
+        """Read image size from disk."""
+
+        cls._import_pil_image()
+        image_size = cls._read_image_size_from_disk(image_ifp)
+        if image_size is not None:
+            width, height = image_size
+            return True, width, height
+        return cls._get_default_image_size(
+            image_ifp, default_width, default_height, op
+        )
+
+    @classmethod
+    def read_image_sizes(
+        cls, image_ifps, default_width, default_height, op=None
+    ):
+        """Read the sizes of several images from disk.
+
+        The image headers are read with multiple threads, since reading many
+        small headers one after another is dominated by the file system
+        latency. Stops at the first image without a valid size and returns a
+        list of :code:`(success, width, height)` tuples.
+        """
+
+        cls._import_pil_image()
+        with ThreadPoolExecutor(max_workers=cls.max_num_threads) as executor:
+            image_sizes = list(
+                executor.map(cls._read_image_size_from_disk, image_ifps)
+            )
+
+        results = []
+        for image_ifp, image_size in zip(image_ifps, image_sizes):
+            if image_size is not None:
+                width, height = image_size
+                result = True, width, height
+            else:
+                result = cls._get_default_image_size(
+                    image_ifp, default_width, default_height, op
+                )
+            results.append(result)
+            if not result[0]:
+                break
+        return results
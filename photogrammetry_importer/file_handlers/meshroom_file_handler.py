@@ -16,14 +16,41 @@ class MeshroomFileHandler:
     # Note: *.SfM files are actually just *.JSON files.
 
     @staticmethod
-    def _get_element(data_list, id_string, query_id):
-        result = None
-        for ele in data_list:
-            if int(ele[id_string]) == query_id:
-                result = ele
-                break
-        assert result is not None
-        return result
+    def _read_json_file(json_ifp):
+        # Meshroom files may contain several megabytes of JSON data. If
+        # available, use orjson, since it decodes such files much faster.
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            with open(json_ifp, "rb") as json_file:
+                json_data = orjson.loads(json_file.read())
+        else:
+            with open(json_ifp, "r") as json_file:
+                json_data = json.load(json_file)
+        return json_data
+
+    @staticmethod
+    def _parse_intrinsic_params(intrinsic_params):
+        focal_length = float(intrinsic_params["pxFocalLength"])
+        cx = float(intrinsic_params["principalPoint"][0])
+        cy = float(intrinsic_params["principalPoint"][1])
+
+        if (
+            "distortionParams" in intrinsic_params
+            and len(intrinsic_params["distortionParams"]) > 0
+        ):
+            # TODO proper handling of distortion parameters
+            radial_distortion = float(intrinsic_params["distortionParams"][0])
+        else:
+            radial_distortion = 0.0
+
+        camera_calibration_matrix = Camera.compute_calibration_mat(
+            focal_length, cx, cy
+        )
+        return camera_calibration_matrix, radial_distortion
 
     @classmethod
     def _parse_cameras_from_json_data(
@@ -62,13 +89,22 @@ class MeshroomFileHandler:
         # Extrinsics may contain only a subset of views!
         # (Not all views are necessarily contained in the reconstruction)
 
+        # Map the ids to the corresponding elements once (instead of searching
+        # the lists for each reconstructed camera)
+        views_by_pose_id = {int(view["poseId"]): view for view in views}
+        intrinsics_by_id = {
+            int(intrinsic["intrinsicId"]): intrinsic
+            for intrinsic in intrinsics
+        }
+        intrinsic_cache = {}
+
         for rec_index, extrinsic in enumerate(extrinsics):
 
             camera = Camera()
             view_index = int(extrinsic["poseId"])
             image_index_to_camera_index[view_index] = rec_index
 
-            corresponding_view = cls._get_element(views, "poseId", view_index)
+            corresponding_view = views_by_pose_id[view_index]
 
             camera.image_fp_type = image_fp_type
             camera.image_dp = image_dp
@@ -88,34 +124,23 @@ class MeshroomFileHandler:
             camera.height = int(corresponding_view["height"])
             id_intrinsic = int(corresponding_view["intrinsicId"])
 
-            intrinsic_params = cls._get_element(
-                intrinsics, "intrinsicId", id_intrinsic
-            )
-
-            focal_length = float(intrinsic_params["pxFocalLength"])
-            cx = float(intrinsic_params["principalPoint"][0])
-            cy = float(intrinsic_params["principalPoint"][1])
-
-            if (
-                "distortionParams" in intrinsic_params
-                and len(intrinsic_params["distortionParams"]) > 0
-            ):
-                # TODO proper handling of distortion parameters
-                radial_distortion = float(
-                    intrinsic_params["distortionParams"][0]
+            # Many views usually share the same intrinsic parameters
+            if id_intrinsic not in intrinsic_cache:
+                intrinsic_cache[id_intrinsic] = cls._parse_intrinsic_params(
+                    intrinsics_by_id[id_intrinsic]
                 )
+                is_new_intrinsic = True
             else:
-                radial_distortion = 0.0
+                is_new_intrinsic = False
+            camera_calibration_matrix, radial_distortion = intrinsic_cache[
+                id_intrinsic
+            ]
 
-            if not suppress_distortion_warnings:
+            if is_new_intrinsic and not suppress_distortion_warnings:
                 check_radial_distortion(
                     radial_distortion, camera._relative_fp, op
                 )
 
-            camera_calibration_matrix = np.array(
-                [[focal_length, 0, cx], [0, focal_length, cy], [0, 0, 1]]
-            )
-
             camera.set_calibration(
                 camera_calibration_matrix, radial_distortion
             )
@@ -151,14 +176,19 @@ class MeshroomFileHandler:
             return points
 
         structure = json_data["structure"]
-        for json_point in structure:
-            custom_point = Point(
-                coord=np.array(json_point["X"], dtype=float),
-                color=np.array(json_point["color"], dtype=int),
-                id=int(json_point["landmarkId"]),
-                scalars=[],
-            )
-            points.append(custom_point)
+        # Convert the values of all points at once (instead of creating
+        # separate arrays for each point)
+        coords = np.array(
+            [json_point["X"] for json_point in structure], dtype=float
+        )
+        colors = np.array(
+            [json_point["color"] for json_point in structure], dtype=int
+        )
+        ids = [int(json_point["landmarkId"]) for json_point in structure]
+        points = [
+            Point(coord=coord, color=color, id=point_id, scalars=[])
+            for coord, color, point_id in zip(coords, colors, ids)
+        ]
         return points
 
     @classmethod
@@ -178,8 +208,7 @@ class MeshroomFileHandler:
         """
         log_report("INFO", "parse_meshroom_sfm_file: ...", op)
         log_report("INFO", "sfm_ifp: " + sfm_ifp, op)
-        input_file = open(sfm_ifp, "r")
-        json_data = json.load(input_file)
+        json_data = cls._read_json_file(sfm_ifp)
 
         (
             cams,
@@ -202,13 +231,18 @@ class MeshroomFileHandler:
 
     @staticmethod
     def _get_latest_node(json_graph, node_type):
-        i = 0
-        while node_type + "_" + str(i + 1) in json_graph:
-            i = i + 1
-        if i == 0:
+        # Scan the node keys (e.g. "StructureFromMotion_3") only once
+        prefix = node_type + "_"
+        numbered_node_keys = [
+            (int(node_key[len(prefix) :]), node_key)
+            for node_key in json_graph
+            if node_key.startswith(prefix)
+            and node_key[len(prefix) :].isdigit()
+        ]
+        if len(numbered_node_keys) == 0:
             return None
         else:
-            return json_graph[node_type + "_" + str(i)]
+            return json_graph[max(numbered_node_keys)[1]]
 
     @classmethod
     def _get_node(cls, json_graph, node_type, node_number, op):
@@ -241,11 +275,19 @@ class MeshroomFileHandler:
             return None
         node_type = data_node["nodeType"]
         uid_0 = data_node["uids"]["0"]
+        data_dp = os.path.join(cache_dp, node_type, uid_0)
+        # List the directory once (instead of probing each file name)
+        try:
+            with os.scandir(data_dp) as dir_entries:
+                existing_fns = {
+                    entry.name for entry in dir_entries if entry.is_file()
+                }
+        except OSError:
+            existing_fns = set()
         data_fp = None
         for fn in fn_list:
-            possible_data_fp = os.path.join(cache_dp, node_type, uid_0, fn)
-            if os.path.isfile(possible_data_fp):
-                data_fp = possible_data_fp
+            if fn in existing_fns:
+                data_fp = os.path.join(data_dp, fn)
                 break
         return data_fp
 
@@ -406,7 +448,7 @@ class MeshroomFileHandler:
         """Parse a :code:`Meshroom` project file (:code:`.mg`)."""
 
         cache_dp = os.path.join(os.path.dirname(mg_fp), "MeshroomCache")
-        json_data = json.load(open(mg_fp, "r"))
+        json_data = cls._read_json_file(mg_fp)
         json_graph = json_data["graph"]
 
         sfm_fp = cls._get_sfm_fp(
@@ -18,11 +18,37 @@ class VisualSfMFileHandler:
     # http://grail.cs.washington.edu/projects/mcba/
     # pba/src/pba/util.h
 
+    @staticmethod
+    def _parse_camera_lines(camera_lines):
+        # Read the camera section
+        # From the docs:
+        # <Camera> = <File name> <focal length> <quaternion WXYZ> <camera center> <radial distortion> 0
+        relative_paths = [
+            line.split(None, 1)[0].replace("/", os.sep)
+            for line in camera_lines
+        ]
+        # Convert the numerical values of all cameras at once, i.e. each
+        # parameter type is represented by a single array
+        camera_values = np.loadtxt(
+            camera_lines, usecols=range(1, 11), comments=None, ndmin=2
+        )
+        focal_lengths = camera_values[:, 0]
+        quaternions = camera_values[:, 1:5]
+        center_vecs = camera_values[:, 5:8]
+        radial_distortions = camera_values[:, 8]
+        assert np.all(camera_values[:, 9] == 0)
+        return (
+            relative_paths,
+            focal_lengths,
+            quaternions,
+            center_vecs,
+            radial_distortions,
+        )
+
     @classmethod
     def _parse_cameras(
         cls,
-        input_file,
-        num_cameras,
+        camera_lines,
         camera_calibration_matrix,
         image_dp,
         image_fp_type,
@@ -45,74 +71,69 @@ class VisualSfMFileHandler:
         """
         # log_report('INFO', '_parse_cameras: ...', op)
         cameras = []
-
-        for i in range(num_cameras):
-            line = input_file.readline()
-
-            # Read the camera section
-            # From the docs:
-            # <Camera> = <File name> <focal length> <quaternion WXYZ> <camera center> <radial distortion> 0
-            line_values = line.split()
-            relative_path = line_values[0].replace("/", os.sep)
-            focal_length = float(line_values[1])
-
-            quaternion_w = float(line_values[2])
-            quaternion_x = float(line_values[3])
-            quaternion_y = float(line_values[4])
-            quaternion_z = float(line_values[5])
-            quaternion = np.array(
-                [quaternion_w, quaternion_x, quaternion_y, quaternion_z],
-                dtype=float,
-            )
-
-            camera_center_x = float(line_values[6])
-            camera_center_y = float(line_values[7])
-            camera_center_z = float(line_values[8])
-            center_vec = np.array(
-                [camera_center_x, camera_center_y, camera_center_z]
-            )
-
-            radial_distortion = float(line_values[9])
-            if not suppress_distortion_warnings:
-                check_radial_distortion(radial_distortion, relative_path, op)
-
-            if camera_calibration_matrix is None:
-                # In this case, we have no information about the principal point
-                # We assume that the principal point lies in the center
-                camera_calibration_matrix = np.array(
-                    [[focal_length, 0, 0], [0, focal_length, 0], [0, 0, 1]]
+        num_cameras = len(camera_lines)
+        if num_cameras == 0:
+            return cameras
+
+        (
+            relative_paths,
+            focal_lengths,
+            quaternions,
+            center_vecs,
+            radial_distortions,
+        ) = cls._parse_camera_lines(camera_lines)
+        rotation_mats = Camera.quaternions_to_rotation_matrices(quaternions)
+        translation_vecs = cls._compute_translation_vector(
+            center_vecs, rotation_mats
+        )
+        # The camera view directions (w.r.t. world coordinates) are used as
+        # normals. The rotation matrices are computed from normalized
+        # quaternions, i.e. they are orthonormal and their inverse is equal to
+        # R^T. Thus, R^T * [0, 0, 1]^T corresponds to the third row of R.
+        cam_view_vecs_world_coord = rotation_mats[:, 2, :]
+
+        if camera_calibration_matrix is None:
+            # In this case, we have no information about the principal point
+            # We assume that the principal point lies in the center
+            camera_calibration_matrices = np.zeros((num_cameras, 3, 3))
+            camera_calibration_matrices[:, 0, 0] = focal_lengths
+            camera_calibration_matrices[:, 1, 1] = focal_lengths
+            camera_calibration_matrices[:, 2, 2] = 1
+        else:
+            camera_calibration_matrices = [
+                camera_calibration_matrix
+            ] * num_cameras
+
+        if not suppress_distortion_warnings:
+            # Only cameras with distortion cause a warning
+            for i in np.flatnonzero(radial_distortions):
+                check_radial_distortion(
+                    radial_distortions[i], relative_paths[i], op
                 )
 
-            zero_value = float(line_values[10])
-            assert zero_value == 0
+        for i in range(num_cameras):
+            relative_path = relative_paths[i]
+            center_vec = center_vecs[i]
+            radial_distortion = radial_distortions[i]
 
             current_camera = Camera()
             # Setting the quaternion also sets the rotation matrix
-            current_camera.set_rotation_with_quaternion(quaternion)
+            current_camera.set_rotation_with_quaternion(
+                quaternions[i], rotation_mat=rotation_mats[i]
+            )
 
             # Set the camera center after rotation
             current_camera._center = center_vec
 
-            # set the camera view direction as normal w.r.t world coordinates
-            cam_view_vec_cam_coord = np.array([0, 0, 1]).T
-            cam_rotation_matrix_inv = np.linalg.inv(
-                current_camera.get_rotation_as_rotation_mat()
-            )
-            cam_view_vec_world_coord = cam_rotation_matrix_inv.dot(
-                cam_view_vec_cam_coord
-            )
-            current_camera.normal = cam_view_vec_world_coord
-
-            translation_vec = cls._compute_translation_vector(
-                center_vec, current_camera.get_rotation_as_rotation_mat()
-            )
-            current_camera._translation_vec = translation_vec
+            current_camera.normal = cam_view_vecs_world_coord[i]
+            current_camera._translation_vec = translation_vecs[i]
 
             current_camera.set_calibration(
-                camera_calibration_matrix, radial_distortion=radial_distortion
+                camera_calibration_matrices[i],
+                radial_distortion=radial_distortion,
             )
             # log_report('INFO', 'Calibration mat:', op)
-            # log_report('INFO', str(camera_calibration_matrix), op)
+            # log_report('INFO', str(camera_calibration_matrices[i]), op)
 
             current_camera.image_fp_type = image_fp_type
             current_camera.image_dp = image_dp
@@ -123,21 +144,49 @@ class VisualSfMFileHandler:
         return cameras
 
     @staticmethod
-    def _parse_nvm_points(input_file, num_3D_points):
+    def _compute_line_offsets(point_block, num_lines):
+        """Return the index of the first value of each line in the block.
 
-        points = []
-        for point_index in range(num_3D_points):
-            # From the VSFM docs:
-            # <Point>  = <XYZ> <RGB> <number of measurements> <List of Measurements>
-            point_line = input_file.readline()
-            point_line_elements = (point_line.rstrip()).split()
-            xyz_vec = list(map(float, point_line_elements[0:3]))
-            rgb_vec = list(map(int, point_line_elements[3:6]))
-            current_point = Point(
-                coord=xyz_vec, color=rgb_vec, id=point_index, scalars=None
-            )
-            points.append(current_point)
+        The points have a variable number of measurements, i.e. the lines
+        contain a variable number of values. The offsets are determined by
+        counting the whitespace separated tokens of each line.
+        """
+        chars = np.frombuffer(point_block.encode(), dtype=np.uint8)
+        is_space = np.isin(chars, np.frombuffer(b" \t\n\r\v\f", np.uint8))
+        is_token_start = ~is_space
+        is_token_start[1:] &= is_space[:-1]
+        line_end_indices = np.flatnonzero(chars == ord("\n"))
+        token_line_indices = np.searchsorted(
+            line_end_indices, np.flatnonzero(is_token_start)
+        )
+        num_tokens_per_line = np.bincount(
+            token_line_indices, minlength=num_lines
+        )
+        line_offsets = np.zeros(num_lines, dtype=np.int64)
+        np.cumsum(num_tokens_per_line[:-1], out=line_offsets[1:])
+        return line_offsets
 
+    @classmethod
+    def _parse_nvm_points(cls, point_lines):
+
+        num_3D_points = len(point_lines)
+        if num_3D_points == 0:
+            return []
+
+        # From the VSFM docs:
+        # <Point>  = <XYZ> <RGB> <number of measurements> <List of Measurements>
+        point_block = "\n".join(point_lines)
+        # Convert all values at once (instead of line by line)
+        point_values = np.fromstring(point_block, sep=" ")
+        line_offsets = cls._compute_line_offsets(point_block, num_3D_points)
+
+        xyz_vecs = point_values[line_offsets[:, np.newaxis] + np.arange(3)]
+        rgb_vecs = point_values[
+            line_offsets[:, np.newaxis] + np.arange(3, 6)
+        ].astype(int)
+
+        # The measurements (i.e. the image projections) are not used
+        points = Point.create_points(xyz_vecs.tolist(), rgb_vecs.tolist())
         return points
 
     @staticmethod
@@ -164,6 +213,14 @@ class VisualSfMFileHandler:
             # log_report('INFO', str(calib_mat), op)
         return calib_mat
 
+    @staticmethod
+    def _get_line(lines, line_index):
+        # Behaves like readline(), i.e. returns an empty string at the end
+        if line_index < len(lines):
+            return lines[line_index]
+        else:
+            return ""
+
     @classmethod
     def parse_visualsfm_file(
         cls,
@@ -175,7 +232,9 @@ class VisualSfMFileHandler:
     ):
         """Parse a :code:`VisualSfM` (:code:`.nvm`) file."""
         log_report("INFO", "Parse NVM file: " + input_visual_fsm_file_name, op)
-        input_file = open(input_visual_fsm_file_name, "r")
+        # Read the whole file at once (instead of line by line)
+        with open(input_visual_fsm_file_name, "r") as input_file:
+            lines = input_file.read().splitlines()
         # Documentation of *.NVM data format
         # http://ccwu.me/vsfm/doc.html#nvm
 
@@ -186,12 +245,13 @@ class VisualSfMFileHandler:
         # <Number of 3D points> <List of points>
 
         # Read the first two lines (fixed)
-        current_line = (input_file.readline()).rstrip()
+        current_line = cls._get_line(lines, 0).rstrip()
         calibration_matrix = cls._parse_fixed_calibration(current_line, op)
-        current_line = (input_file.readline()).rstrip()
+        current_line = cls._get_line(lines, 1).rstrip()
         assert current_line == ""
 
-        amount_cameras = int((input_file.readline()).rstrip())
+        amount_cameras = int(cls._get_line(lines, 2).rstrip())
+        line_index = 3
         log_report(
             "INFO",
             "Amount Cameras (Images in NVM file): " + str(amount_cameras),
@@ -199,17 +259,18 @@ class VisualSfMFileHandler:
         )
 
         cameras = cls._parse_cameras(
-            input_file,
-            amount_cameras,
+            lines[line_index : line_index + amount_cameras],
             calibration_matrix,
             image_dp,
             image_fp_type,
             suppress_distortion_warnings,
             op,
         )
-        current_line = (input_file.readline()).rstrip()
+        line_index += amount_cameras
+        current_line = cls._get_line(lines, line_index).rstrip()
         assert current_line == ""
-        current_line = (input_file.readline()).rstrip()
+        current_line = cls._get_line(lines, line_index + 1).rstrip()
+        line_index += 2
         if current_line.isdigit():
             amount_points = int(current_line)
             log_report(
@@ -218,7 +279,9 @@ class VisualSfMFileHandler:
                 + str(amount_points),
                 op,
             )
-            points = cls._parse_nvm_points(input_file, amount_points)
+            points = cls._parse_nvm_points(
+                lines[line_index : line_index + amount_points]
+            )
         else:
             points = []
 
@@ -296,16 +359,17 @@ class VisualSfMFileHandler:
 
         for camera in cameras:
             quaternion = camera.get_rotation_as_quaternion()
-
-            current_line = camera.get_relative_fp()
-            current_line += "\t" + str(camera.get_calibration_mat()[0][0])
-            current_line += " " + " ".join(list(map(str, quaternion)))
-            current_line += " " + " ".join(
-                list(map(str, camera.get_camera_center()))
+            camera_values = [camera.get_calibration_mat()[0][0]]
+            camera_values.extend(quaternion)
+            camera_values.extend(camera.get_camera_center())
+            camera_values.append(0)  # TODO USE RADIAL DISTORTION
+            camera_values.append(0)
+            current_line = (
+                camera.get_relative_fp()
+                + "\t"
+                + " ".join(map(str, camera_values))
             )
-            current_line += " " + "0"  # TODO USE RADIAL DISTORTION
-            current_line += " " + "0"
-            nvm_content.append(current_line + " " + os.linesep)
+            nvm_content.append(cls._nvm_line(current_line))
 
         nvm_content.append(" " + os.linesep)
         number_points = len(points)
@@ -319,30 +383,24 @@ class VisualSfMFileHandler:
         feature_idx = 0
         x = 0.0
         y = 0.0
+        # The (dummy) measurements are identical for all points
+        # TODO Use the actual measurements (i.e. point.measurements)
+        measurement_str = " ".join(
+            [str(num_features)]
+            + [f"{image_idx} {feature_idx} {x} {y}"] * num_features
+        )
 
         for point in points:
             # From the VSFM docs:
             # <Point>  = <XYZ> <RGB> <number of measurements> <List of Measurements>
-            current_line = " ".join(list(map(str, point.coord)))
-            current_line += " " + " ".join(list(map(str, point.color)))
-
-            # current_line += ' ' + str(len(point.measurements))
-            # for measurement in point.measurements:
-            #     current_line += ' ' + str(measurement)
-            current_line += " " + str(num_features)
-            for feature in range(num_features):
-                current_line += (
-                    " "
-                    + str(image_idx)
-                    + " "
-                    + str(feature_idx)
-                    + " "
-                    + str(x)
-                    + " "
-                    + str(y)
-                )
-
-            nvm_content.append(current_line + " " + os.linesep)
+            current_line = " ".join(
+                [
+                    " ".join(map(str, point.coord)),
+                    " ".join(map(str, point.color)),
+                    measurement_str,
+                ]
+            )
+            nvm_content.append(cls._nvm_line(current_line))
 
         nvm_content.append(" " + os.linesep)
         nvm_content.append(" " + os.linesep)
@@ -362,8 +420,8 @@ class VisualSfMFileHandler:
         )
         nvm_content.append("0" + os.linesep)
 
-        output_file = open(output_nvm_file_name, "wb")
-        output_file.writelines([item.encode() for item in nvm_content])
+        with open(output_nvm_file_name, "wb") as output_file:
+            output_file.write("".join(nvm_content).encode())
 
         log_report("INFO", "Write NVM file: Done", op)
 
@@ -373,8 +431,10 @@ class VisualSfMFileHandler:
         """
         x_cam = R (X - C) = RX - RC == RX + t
         <=> t = -RC
+
+        Supports single cameras (3 and 3 x 3) as well as stacks of cameras
+        (N x 3 and N x 3 x 3).
         """
-        t = np.zeros(3, dtype=float)
-        for j in range(0, 3):
-            t[j] = -float(R[j][0] * c[0] + R[j][1] * c[1] + R[j][2] * c[2])
-        return t
+        R = np.asarray(R, dtype=float)
+        c = np.asarray(c, dtype=float)
+        return -np.einsum("...ij,...j->...i", R, c)
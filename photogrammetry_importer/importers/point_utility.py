@@ -284,7 +284,12 @@ def add_points_as_mesh_vertices(
     point_cloud_mesh.update()
     point_cloud_mesh.validate()
     coords, colors = Point.split_points(points, normalize_colors=False)
-    point_cloud_mesh.from_pydata(coords, [], [])
+    # Set the coordinates of all vertices with a single call
+    point_cloud_mesh.vertices.add(len(coords))
+    point_cloud_mesh.vertices.foreach_set(
+        "co", np.asarray(coords, dtype=np.float32).ravel()
+    )
+    point_cloud_mesh.update()
     point_cloud_obj = add_obj(
         point_cloud_mesh, point_cloud_obj_name, reconstruction_collection
     )
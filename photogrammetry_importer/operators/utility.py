@@ -12,14 +12,12 @@ def set_image_size_for_cameras(
 
     log_report("INFO", "set_image_size_for_cameras: ", op)
     success = True
-    for camera in cameras:
-        image_fp = camera.get_absolute_fp()
-        success, width, height = ImageFileHandler.read_image_size(
-            image_fp, default_width, default_height, op
-        )
+    image_fps = [camera.get_absolute_fp() for camera in cameras]
+    image_sizes = ImageFileHandler.read_image_sizes(
+        image_fps, default_width, default_height, op
+    )
+    for camera, (success, width, height) in zip(cameras, image_sizes):
         camera.width = width
         camera.height = height
-        if not success:
-            break
     log_report("INFO", "set_image_size_for_cameras: Done", op)
     return success
@@ -206,6 +206,9 @@ class OptionalDependencyManager:
                 package_name="pyntcloud",
                 import_name="pyntcloud",
             ),
+            OptionalDependency(
+                gui_name="Orjson", package_name="orjson", import_name="orjson"
+            ),
         )
 
     def install_dependencies(self, op=None):
@@ -238,11 +238,18 @@ class Camera:
             dtype=float,
         )
 
-    def set_rotation_with_quaternion(self, quaternion):
-        """Set the camera rotation using a quaternion."""
+    def set_rotation_with_quaternion(self, quaternion, rotation_mat=None):
+        """Set the camera rotation using a quaternion.
+
+        If the rotation matrix corresponding to the quaternion has already
+        been computed (e.g. with :code:`quaternions_to_rotation_matrices()`),
+        it can be provided to skip the conversion.
+        """
         self._quaternion = quaternion
         # We must change the rotation matrixes as well.
-        self._rotation_mat = Camera.quaternion_to_rotation_matrix(quaternion)
+        if rotation_mat is None:
+            rotation_mat = Camera.quaternion_to_rotation_matrix(quaternion)
+        self._rotation_mat = rotation_mat
 
     def set_rotation_with_rotation_mat(
         self, rotation_mat, check_rotation=True
@@ -337,6 +344,35 @@ class Camera:
         m[2][2] = float(qz * qz + qw * qw - qy * qy - qx * qx)
         return m
 
+    @staticmethod
+    def quaternions_to_rotation_matrices(quaternions):
+        """Convert quaternions (N x 4) to rotation matrices (N x 3 x 3).
+
+        Vectorized version of :code:`quaternion_to_rotation_matrix()`.
+        """
+        quaternions = np.asarray(quaternions, dtype=float).reshape(-1, 4)
+        qq = np.linalg.norm(quaternions, axis=1)
+        is_valid = qq > 0
+        # Normalize the quaternions (invalid ones are replaced by identity)
+        normalized_quaternions = np.zeros_like(quaternions)
+        normalized_quaternions[:, 0] = 1
+        normalized_quaternions[is_valid] = (
+            quaternions[is_valid] / qq[is_valid, np.newaxis]
+        )
+        qw, qx, qy, qz = normalized_quaternions.T
+
+        m = np.empty((len(quaternions), 3, 3), dtype=float)
+        m[:, 0, 0] = qw * qw + qx * qx - qz * qz - qy * qy
+        m[:, 0, 1] = 2 * qx * qy - 2 * qz * qw
+        m[:, 0, 2] = 2 * qy * qw + 2 * qz * qx
+        m[:, 1, 0] = 2 * qx * qy + 2 * qw * qz
+        m[:, 1, 1] = qy * qy + qw * qw - qz * qz - qx * qx
+        m[:, 1, 2] = 2 * qz * qy - 2 * qx * qw
+        m[:, 2, 0] = 2 * qx * qz - 2 * qy * qw
+        m[:, 2, 1] = 2 * qy * qz + 2 * qw * qx
+        m[:, 2, 2] = qz * qz + qw * qw - qy * qy - qx * qx
+        return m
+
     @staticmethod
     def rotation_matrix_to_quaternion(m):
         """Convert a rotation matrix to a quaternion."""
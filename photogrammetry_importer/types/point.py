@@ -1,4 +1,5 @@
 from collections import namedtuple
+import numpy as np
 
 
 class Point(namedtuple("Point", ["coord", "color", "id", "scalars"])):
@@ -11,23 +12,21 @@ class Point(namedtuple("Point", ["coord", "color", "id", "scalars"])):
     @staticmethod
     def split_points(points, normalize_colors=False):
         """Split points into coordinates and colors."""
-        coords = []
-        colors = []
+        coords = [point.coord for point in points]
 
         if normalize_colors:
             color_normalize_factor = 255.0
         else:
             color_normalize_factor = 1
 
-        for point in points:
-            coords.append(point.coord)
-            color_with_alpha = [
-                point.color[0] / color_normalize_factor,
-                point.color[1] / color_normalize_factor,
-                point.color[2] / color_normalize_factor,
-                1.0,
-            ]
-            colors.append(color_with_alpha)
+        # Convert the colors of all points at once
+        colors_with_alpha = np.ones((len(points), 4), dtype=float)
+        if len(points) > 0:
+            colors_with_alpha[:, 0:3] = (
+                np.array([point.color[0:3] for point in points], dtype=float)
+                / color_normalize_factor
+            )
+        colors = colors_with_alpha.tolist()
         return coords, colors
 
     @staticmethod